@@ -7,6 +7,7 @@ import geopandas
 from geopandas.plotting import plot_polygon_collection
 
 import parser
+import synthetic
 from vehicle import VehicleController
 
 def plot(geopandaMap, plotAxis, edgeColors, title=None, save=False, extra=None):
@@ -48,10 +49,21 @@ p = 0.02
 numDataSets = 6
 crit = 2
 
+# Synthetic demand parameters (no TLC data needed)
+useSyntheticTrips = False
+scale = 1
+seed = 0
+
 print("Generating trips...")
-trips, zoneDist = parser.generateTripsAndZoneDist("./data/output.csv", numDataSets, p)
-numTrips = len(trips)
-print(f"Number of trips: {numTrips}")
+if useSyntheticTrips:
+    zoneDist = synthetic.defaultZoneDist()
+    model = synthetic.fitDemandModel(zoneDist=zoneDist, tripsPerDay=int(synthetic.DEFAULT_DAILY_TRIPS * p))
+    tripStream = synthetic.streamTrips(model, scale, seed)
+    print(f"Expected number of trips: {int(model['tripsPerDay'] * scale)}")
+else:
+    trips, zoneDist = parser.generateTripsAndZoneDist("./data/output.csv", numDataSets, p)
+    tripStream = parser.streamTripsByMinute(trips)
+    print(f"Number of trips: {len(trips)}")
 
 # Initate controller
 idealZoneDist = np.array(list(zoneDist.values()))
@@ -70,37 +82,35 @@ if False:
 parkingDemand = {k: 0 for k in zoneIdMap.keys()}
 zoneAvgWait = {k: 0 for k in zoneIdMap.keys()}
 distGraph = []
+numTrips = 0
 
 print("Starting simulation day")
-for hour in range(24):
-    hourTrips = trips[trips[:,0] == hour]
-    for minute in range(60):
-
-        print(f"\nTime {hour}:{minute}")
+for hour, minute, tripsToStart in tripStream:
+    print(f"\nTime {hour}:{minute}")
 
-        tripsToStart = hourTrips[hourTrips[:,1] == minute]
-        controller.matchVehicles(tripsToStart)
+    numTrips += len(tripsToStart)
+    controller.matchVehicles(tripsToStart)
 
-        # Update parking demand
-        for vehicle in controller.parkedVehicles:
-            parkingDemand[vehicle.currentZone] += 1
+    # Update parking demand
+    for vehicle in controller.parkedVehicles:
+        parkingDemand[vehicle.currentZone] += 1
 
-        # Calculate current vehicle distribution and variance
-        availibleVehicles = controller.roamingVehicles + controller.parkedVehicles
-        vehicleCountMap = {k: 0 for k in zoneIdMap.keys()}
-        for vehicle in availibleVehicles:
-            vehicleCountMap[vehicle.getCurrentZone()] += 1
-        currDist = np.array(list(vehicleCountMap.values())) / len(availibleVehicles)
+    # Calculate current vehicle distribution and variance
+    availibleVehicles = controller.roamingVehicles + controller.parkedVehicles
+    vehicleCountMap = {k: 0 for k in zoneIdMap.keys()}
+    for vehicle in availibleVehicles:
+        vehicleCountMap[vehicle.getCurrentZone()] += 1
+    currDist = np.array(list(vehicleCountMap.values())) / len(availibleVehicles)
 
-        bhatDistance = -1 * np.log(np.sum([np.sqrt(p * q) for p, q in zip(idealZoneDist, currDist)]))
-        distGraph.append(bhatDistance)
+    bhatDistance = -1 * np.log(np.sum([np.sqrt(p * q) for p, q in zip(idealZoneDist, currDist)]))
+    distGraph.append(bhatDistance)
 
-        # Update all vehicles
-        controller.updateVehicles(bhatDistance)
+    # Update all vehicles
+    controller.updateVehicles(bhatDistance)
 
-        print(f"Bhattacharyya distance: {bhatDistance}")
-        print(f"High priority trips: {len(controller.highPriorityTrips)}")
-        print(f"Roaming vehicles: {len(controller.roamingVehicles)}")
+    print(f"Bhattacharyya distance: {bhatDistance}")
+    print(f"High priority trips: {len(controller.highPriorityTrips)}")
+    print(f"Roaming vehicles: {len(controller.roamingVehicles)}")
 
 print("\nEND\n")
 
@@ -70,6 +70,21 @@ def generateTripsAndZoneDist(filename, numDataSets, percentUsing):
 
     return np.array(trips), zoneDistribution
 
+def streamTripsByMinute(trips):
+    """
+    Splits sampled trips into the trips starting at each minute of the simulation day
+
+    Args:
+        trips: numpy array of trips in the parsed format [hour, minute, pickup, dropoff]
+
+    Returns:
+        Generator yielding (hour, minute, trips) for every minute of the day
+    """
+    for hour in range(24):
+        hourTrips = trips[trips[:,0] == hour]
+        for minute in range(60):
+            yield hour, minute, hourTrips[hourTrips[:,1] == minute]
+
 def readZoneIdMap():
     """
     Reads in csv and returns a map: zoneId -> location name
@@ -0,0 +1,121 @@
+import numpy as np
+
+import parser
+
+# Approximate share of daily NYC yellow taxi pickups starting in each hour (2018)
+DEFAULT_HOUR_PROFILE = np.array([
+    3.2, 2.3, 1.7, 1.2, 1.0, 1.0, 2.0, 3.4, 4.2, 4.3, 4.2, 4.4,
+    4.6, 4.6, 4.8, 4.7, 4.3, 5.0, 5.9, 6.1, 5.6, 5.6, 5.4, 4.3
+])
+
+# Approximate number of NYC yellow taxi trips per day (2018)
+DEFAULT_DAILY_TRIPS = 280000
+
+def defaultZoneDist():
+    """
+    Builds a uniform zone distribution for when no parsed TLC data is available
+
+    Args:
+        None
+
+    Returns:
+        zoneDistribution: dictionary containing (zoneId, pmfVal) pairs describing city
+    """
+    zoneIds = list(parser.readZoneIdMap().keys())
+    return {k: 1 / len(zoneIds) for k in zoneIds}
+
+def fitDemandModel(trips=None, zoneDist=None, tripsPerDay=None):
+    """
+    Fits an hourly x origin x destination demand model
+
+    Args:
+        trips: optional numpy array in the parsed format [hour, minute, pickup, dropoff],
+            e.g. output of generateTripsAndZoneDist, used for empirical hourly OD counts
+        zoneDist: optional dictionary of (zoneId, pmfVal) pairs used as the OD prior,
+            defaults to a uniform distribution over all zones
+        tripsPerDay: optional base number of trips per day, defaults to len(trips)
+            or DEFAULT_DAILY_TRIPS
+
+    Returns:
+        model: dictionary with the zone ids, hourly distribution, per hour OD cdfs
+            and base trips per day
+    """
+    if zoneDist is None:
+        zoneDist = defaultZoneDist()
+
+    zoneIds = np.array(sorted(zoneDist.keys()))
+    numZones = len(zoneIds)
+
+    # Prior OD matrix: independent pickup / dropoff by zone weight, no same zone trips
+    zoneWeights = np.array([zoneDist[k] for k in zoneIds], dtype=float)
+    prior = np.outer(zoneWeights, zoneWeights)
+    np.fill_diagonal(prior, 0)
+    prior = prior.ravel() / prior.sum()
+
+    if trips is None or len(trips) == 0:
+        hourDist = DEFAULT_HOUR_PROFILE / DEFAULT_HOUR_PROFILE.sum()
+        odDist = np.tile(prior, (24, 1))
+        if tripsPerDay is None:
+            tripsPerDay = DEFAULT_DAILY_TRIPS
+    else:
+        trips = np.asarray(trips).astype(int)
+        origins = np.searchsorted(zoneIds, trips[:, 2])
+        destinations = np.searchsorted(zoneIds, trips[:, 3])
+
+        odDist = np.zeros((24, numZones * numZones))
+        np.add.at(odDist, (trips[:, 0], origins * numZones + destinations), 1)
+
+        hourCounts = odDist.sum(axis=1)
+        hourDist = hourCounts / hourCounts.sum()
+
+        # Hours without any observed trips fall back to the prior
+        odDist[hourCounts == 0] = prior
+        odDist /= odDist.sum(axis=1, keepdims=True)
+        if tripsPerDay is None:
+            tripsPerDay = len(trips)
+
+    odCdf = np.cumsum(odDist, axis=1)
+    odCdf[:, -1] = 1.0
+
+    return {
+        'zoneIds': zoneIds,
+        'hourDist': hourDist,
+        'odCdf': odCdf,
+        'tripsPerDay': tripsPerDay
+    }
+
+def streamTrips(model, scale=1, seed=None):
+    """
+    Lazily generates a simulation day of synthetic trips, one minute at a time
+
+    Only a single minute of trips is held in memory, so the simulation loop can
+    consume arbitrarily scaled demand
+
+    Args:
+        model: demand model returned by fitDemandModel
+        scale: multiplier applied to the model's trips per day
+        seed: seed for the random generator, same seed gives the same day
+
+    Returns:
+        Generator yielding (hour, minute, trips) where trips is a numpy array in
+        the parsed format [hour, minute, pickup, dropoff]
+    """
+    rng = np.random.default_rng(seed)
+    zoneIds = model['zoneIds']
+    numZones = len(zoneIds)
+    tripsPerMinute = model['tripsPerDay'] * scale * model['hourDist'] / 60
+
+    for hour in range(24):
+        cdf = model['odCdf'][hour]
+        for minute in range(60):
+            count = rng.poisson(tripsPerMinute[hour])
+            pairs = np.searchsorted(cdf, rng.random(count), side='right')
+            pairs = np.minimum(pairs, len(cdf) - 1)
+
+            trips = np.empty((count, 4), dtype=int)
+            trips[:, 0] = hour
+            trips[:, 1] = minute
+            trips[:, 2] = zoneIds[pairs // numZones]
+            trips[:, 3] = zoneIds[pairs % numZones]
+
+            yield hour, minute, trips